@@ -2,6 +2,9 @@ from typing import Dict, List, Any, Optional, Union
 from enum import Enum
 from pydantic import BaseModel, Field, validator
 import time
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import traceback
 
@@ -329,6 +332,10 @@ class CommandExecutor:
             base_url: Base URL for service API endpoints
         """
         self.base_url = base_url
+        # Keep-alive connections to the services, reused across commands;
+        # sized for execute_batch running one worker per service
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=3, pool_maxsize=8))
         self.service_ports = {
             ServiceType.GRID: 8002,
             ServiceType.EMERGENCY: 8003,
@@ -364,9 +371,6 @@ class CommandExecutor:
         Returns:
             Result of the command execution
         """
-        import requests
-        import time
-        
         service = command.service
         action = command.action
         parameters = command.parameters
@@ -422,11 +426,11 @@ class CommandExecutor:
                 logger.info(f"Executing {action} on {service} service")
             
             if method == "GET":
-                response = requests.get(url, params=data, timeout=10)
+                response = self.session.get(url, params=data, timeout=10)
             elif method == "POST":
-                response = requests.post(url, json=data, timeout=10)
+                response = self.session.post(url, json=data, timeout=10)
             elif method == "PUT":
-                response = requests.put(url, json=data, timeout=10)
+                response = self.session.put(url, json=data, timeout=10)
             else:
                 return CommandResult(
                     command=command,
@@ -510,6 +514,49 @@ class CommandExecutor:
                 status=CommandStatus.FAILURE
             )
     
+    def execute_batch(self, commands: List[Command]) -> List[CommandResult]:
+        """
+        Execute commands with one worker per service.
+        
+        Commands for the same service run in their original order, so
+        dependent actions (e.g. assign a drone, then update its incident)
+        still see each other's effects; different services run concurrently.
+        
+        Args:
+            commands: The commands to execute
+            
+        Returns:
+            Results in the same order as the commands
+        """
+        groups: Dict[ServiceType, List[int]] = {}
+        for index, command in enumerate(commands):
+            groups.setdefault(command.service, []).append(index)
+        
+        results: List[Optional[CommandResult]] = [None] * len(commands)
+        
+        def run_group(indexes: List[int]) -> None:
+            for index in indexes:
+                try:
+                    results[index] = self.execute(commands[index])
+                except Exception as e:
+                    # One malformed command must not abort the rest of its service's batch
+                    results[index] = CommandResult(
+                        command=commands[index],
+                        success=False,
+                        error=str(e),
+                        execution_time=0.0,
+                        status=CommandStatus.FAILURE
+                    )
+        
+        if len(groups) <= 1:
+            for indexes in groups.values():
+                run_group(indexes)
+        else:
+            with ThreadPoolExecutor(max_workers=len(groups)) as pool:
+                list(pool.map(run_group, groups.values()))
+        
+        return results
+    
     def _map_to_endpoint(self, service: ServiceType, action: str, parameters: Dict[str, Any]) -> tuple:
         """Map a command to its corresponding API endpoint and HTTP method."""
         # Define endpoint mappings for each service and action
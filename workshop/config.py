@@ -20,6 +20,9 @@ class VerbosityLevel(str, Enum):
     VERBOSE = "verbose"    # Detailed output
     DEBUG = "debug"        # Full debug output
 
+# Levels that enable detailed (debug) logging
+VERBOSE_LEVELS = frozenset({VerbosityLevel.VERBOSE, VerbosityLevel.DEBUG})
+
 
 # Default configuration
 DEFAULT_CONFIG = {
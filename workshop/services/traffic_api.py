@@ -1,17 +1,23 @@
-from fastapi import FastAPI, Query, HTTPException, Depends, Path, Body, Request
-from pydantic import BaseModel
+from fastapi import FastAPI, Query, HTTPException, Depends, Path
+from fastapi.responses import Response
+from pydantic import BaseModel, Field
 from typing import Dict, Any, Optional
 import sys
 import os
 import time
 import random
+import heapq
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 import logging
+import orjson
 
 # Use relative imports for workshop modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-from workshop.config import get_verbosity, VerbosityLevel
+from workshop.config import get_verbosity, VerbosityLevel, VERBOSE_LEVELS
 from workshop.day_seed_generator import DaySeedGenerator
 
 # Configure logger
@@ -19,29 +25,114 @@ logger = logging.getLogger("traffic_service")
 
 app = FastAPI(title="NeoCatalis Traffic Service - Simplified")
 
+# Models
+class TrafficStatus(str, Enum):
+    CLEAR = "clear"
+    MODERATE = "moderate"
+    HEAVY = "heavy"
+    GRIDLOCK = "gridlock"
+    BLOCKED = "blocked"
+
+_STATUS_VALUES = tuple(status.value for status in TrafficStatus)
+
+# Statuses are stored as TrafficStatus members and only turned back into
+# plain strings when a response is serialized
+_STATUS_BY_VALUE = {status.value: status for status in TrafficStatus}
+_STATUS_TO_STR = {status: status.value for status in TrafficStatus}
+
+def _coerce_status(status: str):
+    """Return the TrafficStatus member for a status string, leaving unknown values as-is."""
+    return _STATUS_BY_VALUE.get(status, status)
+
+def _status_str(status) -> str:
+    """Materialize a stored status as its plain string value."""
+    return _STATUS_TO_STR.get(status, status)
+
+# Congestion thresholds and the status/flow labels for each bucket
+_STATUS_THRESHOLDS = (0.3, 0.6, 0.9)
+_STATUS_LUT = (TrafficStatus.CLEAR, TrafficStatus.MODERATE, TrafficStatus.HEAVY, TrafficStatus.GRIDLOCK)
+_FLOW_THRESHOLDS = (0.3, 0.5, 0.7, 0.9)
+_FLOW_LUT = ("excellent", "good", "moderate", "poor", "critical")
+
+def classify_congestion(congestion: float) -> TrafficStatus:
+    """Map a congestion level to its traffic status bucket."""
+    return _STATUS_LUT[bisect_right(_STATUS_THRESHOLDS, congestion)]
+
+@dataclass(slots=True)
+class Sector:
+    """In-memory record for a single traffic sector."""
+    sector_id: str
+    status: TrafficStatus
+    congestion_level: float
+    is_blocked: bool
+    travel_time_multiplier: float
+    block_reason: Optional[str] = None
+    block_duration_minutes: Optional[int] = None
+    block_end_time: Optional[float] = None
+
+def generate_sectors(generator: DaySeedGenerator, num_sectors: int = 10) -> Dict[str, Sector]:
+    """Generate the day's sectors as Sector records."""
+    return {
+        sector_id: Sector(
+            sector_id,
+            _coerce_status(data["status"]),
+            data["congestion_level"],
+            data["is_blocked"],
+            data["travel_time_multiplier"]
+        )
+        for sector_id, data in generator.generate_traffic_data(num_sectors=num_sectors).items()
+    }
+
 # Global state
 current_day = datetime.now().day
 traffic_generator = DaySeedGenerator(day=current_day)
-traffic_sectors = traffic_generator.generate_traffic_data(num_sectors=10)
+traffic_sectors = generate_sectors(traffic_generator)
 service_health = {
     "status": "healthy",
     "latency": 0.1,
     "error_rate": 0.0,
 }
+_health_bytes = orjson.dumps(service_health)
+
+# Guards mutations of traffic_sectors since handlers run in the threadpool
+_state_lock = threading.Lock()
+
+def _unblocked_sectors(sectors: Dict[str, Sector]) -> list:
+    """List the sectors that can still absorb spillover traffic."""
+    return [sector for sector in sectors.values() if not sector.is_blocked]
+
+# Unblocked sectors, kept in step with traffic_sectors for the spillover loop
+_active_sectors = _unblocked_sectors(traffic_sectors)
+
+# Bumped on every mutation so the serialized condition report can be reused
+_state_version = 0
+_report_cache = None  # ((state_version, description), serialized report)
+
+# Immutable serialized copy of the sectors served by /state/get without locking
+_state_snapshot = orjson.dumps({"sectors": traffic_sectors})
+
+def _mark_state_changed():
+    """Invalidate cached reports and refresh the state snapshot; call while holding _state_lock."""
+    global _state_version, _state_snapshot
+    _state_version += 1
+    _state_snapshot = orjson.dumps({"sectors": traffic_sectors})
 
 # Log service startup
 if get_verbosity() != VerbosityLevel.SILENT:
     logger.info("Simplified Traffic service initialized")
-    if get_verbosity() in [VerbosityLevel.VERBOSE, VerbosityLevel.DEBUG]:
-        logger.debug(f"Initial sectors: {len(traffic_sectors)}")
+    if logger.isEnabledFor(logging.DEBUG) and get_verbosity() in VERBOSE_LEVELS:
+        logger.debug("Initial sectors: %d", len(traffic_sectors))
 
-# Models
-class TrafficStatus(str, Enum):
-    CLEAR = "clear"
-    MODERATE = "moderate"
-    HEAVY = "heavy"
-    GRIDLOCK = "gridlock"
-    BLOCKED = "blocked"
+# Fields are optional so a missing one is still reported as a 400 by the
+# handler, and so query-parameter callers can send no body at all
+class RedirectRequest(BaseModel):
+    sector_id: Optional[str] = None
+    target_reduction: Optional[float] = Field(None, ge=0.0, le=1.0)
+
+class BlockRouteRequest(BaseModel):
+    sector: Optional[str] = None
+    reason: Optional[str] = None
+    duration_minutes: Optional[int] = None
 
 class ServiceHealthResponse(BaseModel):
     status: str
@@ -64,11 +155,11 @@ def get_service_status():
 # SIMPLIFIED CORE ENDPOINTS - Only 3 essential actions
 # ============================================================================
 
-@app.post("/traffic/redirect", response_model=Dict[str, Any])
-async def redirect_traffic(
-    sector_id: str = Query(None),
-    target_reduction: float = Query(0.5, ge=0.0, le=1.0),
-    body: Dict[str, Any] = Body(None),
+@app.post("/traffic/redirect")
+def redirect_traffic(
+    req: Optional[RedirectRequest] = None,
+    sector_id: Optional[str] = Query(None),
+    target_reduction: Optional[float] = Query(None, ge=0.0, le=1.0),
     service_status: Dict = Depends(get_service_status)
 ):
     """
@@ -76,95 +167,129 @@ async def redirect_traffic(
     
     This is one of the 3 essential traffic actions.
     """
-    if get_verbosity() in [VerbosityLevel.VERBOSE, VerbosityLevel.DEBUG]:
-        logger.debug(f"Redirecting traffic in sector {sector_id}")
-    
-    # Handle both query parameter and request body
-    if sector_id is None and body:
-        sector_id = body.get("sector_id")
-    
-    if target_reduction is None and body:
-        target_reduction = body.get("target_reduction", 0.5)
+    # Query parameters are still accepted for older callers
+    if req is not None:
+        if sector_id is None:
+            sector_id = req.sector_id
+        if target_reduction is None:
+            target_reduction = req.target_reduction
+    if target_reduction is None:
+        target_reduction = 0.5
     
     if sector_id is None:
         raise HTTPException(status_code=400, detail="sector_id is required")
     
-    # Validate sector exists
-    if sector_id not in traffic_sectors:
-        raise HTTPException(status_code=404, detail=f"Sector {sector_id} not found")
+    if logger.isEnabledFor(logging.DEBUG) and get_verbosity() in VERBOSE_LEVELS:
+        logger.debug("Redirecting traffic in sector %s", sector_id)
     
-    sector = traffic_sectors[sector_id]
+    with _state_lock:
+        # Validate sector exists
+        if sector_id not in traffic_sectors:
+            raise HTTPException(status_code=404, detail=f"Sector {sector_id} not found")
     
-    # Check if sector is blocked
-    if sector.get("is_blocked", False):
-        raise HTTPException(
-            status_code=400, 
-            detail=f"Cannot redirect traffic in blocked sector {sector_id}"
-        )
+        sector = traffic_sectors[sector_id]
     
-    # Calculate current congestion
-    current_congestion = sector.get("congestion_level", 0.0)
-    old_congestion = current_congestion
+        # Check if sector is blocked
+        if sector.is_blocked:
+            raise HTTPException(
+                status_code=400, 
+                detail=f"Cannot redirect traffic in blocked sector {sector_id}"
+            )
     
-    # Apply traffic reduction
-    new_congestion = max(0.0, current_congestion * (1.0 - target_reduction))
-    sector["congestion_level"] = new_congestion
+        # Calculate current congestion
+        current_congestion = sector.congestion_level
+        old_congestion = current_congestion
     
-    # Update travel time multiplier based on new congestion
-    sector["travel_time_multiplier"] = 1.0 + (new_congestion * 2.0)
+        # Apply traffic reduction
+        new_congestion = max(0.0, current_congestion * (1.0 - target_reduction))
+        sector.congestion_level = new_congestion
     
-    # Update status based on new congestion level
-    if new_congestion < 0.3:
-        sector["status"] = TrafficStatus.CLEAR
-    elif new_congestion < 0.6:
-        sector["status"] = TrafficStatus.MODERATE
-    elif new_congestion < 0.9:
-        sector["status"] = TrafficStatus.HEAVY
-    else:
-        sector["status"] = TrafficStatus.GRIDLOCK
+        # Update travel time multiplier based on new congestion
+        travel_time_multiplier = 1.0 + (new_congestion * 2.0)
+        sector.travel_time_multiplier = travel_time_multiplier
+    
+        # Update status based on new congestion level
+        new_status = classify_congestion(new_congestion)
+        sector.status = new_status
+        _mark_state_changed()
     
     # Calculate actual reduction achieved
     actual_reduction = (old_congestion - new_congestion) / old_congestion if old_congestion > 0 else 0
     
     if get_verbosity() != VerbosityLevel.SILENT:
-        logger.info(f"Traffic redirected in sector {sector_id}: {old_congestion:.2f} -> {new_congestion:.2f}")
+        logger.info("Traffic redirected in sector %s: %.2f -> %.2f", sector_id, old_congestion, new_congestion)
     
-    return {
+    return Response(orjson.dumps({
         "success": True,
         "sector_id": sector_id,
         "old_congestion": old_congestion,
         "new_congestion": new_congestion,
         "target_reduction": target_reduction,
         "actual_reduction": actual_reduction,
-        "new_status": sector["status"],
-        "travel_time_multiplier": sector["travel_time_multiplier"]
-    }
+        "new_status": new_status.value,
+        "travel_time_multiplier": travel_time_multiplier
+    }), media_type="application/json")
 
-@app.post("/traffic/block_route", response_model=Dict[str, Any])
-async def block_route(
-    service_status: Dict = Depends(get_service_status),
-    sector: Optional[str] = None,
-    reason: Optional[str] = None,
-    duration_minutes: Optional[int] = None,
-    request: Request = None
+def _apply_route_block(sector: str, reason: str, duration_minutes: Optional[int]):
+    """Block a sector and spill part of its congestion onto the others."""
+    global _active_sectors
+    
+    with _state_lock:
+        # Validate sector exists
+        if sector not in traffic_sectors:
+            raise HTTPException(status_code=404, detail=f"Sector {sector} not found")
+        
+        sector_data = traffic_sectors[sector]
+        old_status = sector_data.status
+        
+        # Block the sector
+        sector_data.status = TrafficStatus.BLOCKED
+        sector_data.is_blocked = True
+        sector_data.block_reason = reason
+        sector_data.travel_time_multiplier = 5.0  # Significantly increased travel time
+        
+        if duration_minutes:
+            sector_data.block_duration_minutes = duration_minutes
+            # In a real system, you'd set up a timer to unblock after duration
+            sector_data.block_end_time = time.time() + (duration_minutes * 60)
+        
+        _active_sectors = [other for other in _active_sectors if other is not sector_data]
+        
+        # Increase congestion in neighboring sectors (simplified simulation)
+        congestion_spillover = sector_data.congestion_level * 0.3
+        spillover_amount = congestion_spillover * 0.1
+        for other_sector in _active_sectors:
+            # Add some of the blocked sector's congestion to neighbors
+            new_congestion = other_sector.congestion_level + spillover_amount
+            if new_congestion > 1.0:
+                new_congestion = 1.0
+            other_sector.congestion_level = new_congestion
+            
+            # Update travel time multiplier
+            other_sector.travel_time_multiplier = 1.0 + (new_congestion * 2.0)
+        
+        _mark_state_changed()
+    
+    return old_status, congestion_spillover
+
+@app.post("/traffic/block_route")
+def block_route(
+    req: Optional[BlockRouteRequest] = None,
+    sector: Optional[str] = Query(None),
+    reason: Optional[str] = Query(None),
+    duration_minutes: Optional[int] = Query(None),
+    service_status: Dict = Depends(get_service_status)
 ):
     """
     CORE ACTION: Block a route in a specific sector.
     
     This is one of the 3 essential traffic actions.
     """
-    if get_verbosity() in [VerbosityLevel.VERBOSE, VerbosityLevel.DEBUG]:
-        logger.debug(f"Blocking route in sector: {sector}")
-    
-    # Handle both query parameter and request body
-    if sector is None and request:
-        try:
-            body = await request.json()
-            sector = body.get("sector")
-            reason = body.get("reason")
-            duration_minutes = body.get("duration_minutes")
-        except:
-            pass
+    # Query parameters are still accepted for older callers
+    if sector is None and req is not None:
+        sector = req.sector
+        reason = req.reason
+        duration_minutes = req.duration_minutes
     
     if sector is None:
         raise HTTPException(status_code=400, detail="Sector parameter is required")
@@ -172,52 +297,27 @@ async def block_route(
     if reason is None:
         raise HTTPException(status_code=400, detail="Reason parameter is required")
     
-    # Validate sector exists
-    if sector not in traffic_sectors:
-        raise HTTPException(status_code=404, detail=f"Sector {sector} not found")
-    
-    sector_data = traffic_sectors[sector]
-    old_status = sector_data["status"]
-    
-    # Block the sector
-    sector_data["status"] = TrafficStatus.BLOCKED
-    sector_data["is_blocked"] = True
-    sector_data["block_reason"] = reason
-    sector_data["travel_time_multiplier"] = 5.0  # Significantly increased travel time
+    if logger.isEnabledFor(logging.DEBUG) and get_verbosity() in VERBOSE_LEVELS:
+        logger.debug("Blocking route in sector: %s", sector)
     
-    if duration_minutes:
-        sector_data["block_duration_minutes"] = duration_minutes
-        # In a real system, you'd set up a timer to unblock after duration
-        sector_data["block_end_time"] = datetime.now().timestamp() + (duration_minutes * 60)
-    
-    # Increase congestion in neighboring sectors (simplified simulation)
-    congestion_spillover = sector_data.get("congestion_level", 0.0) * 0.3
-    for other_sector_id, other_sector in traffic_sectors.items():
-        if other_sector_id != sector and not other_sector.get("is_blocked", False):
-            # Add some of the blocked sector's congestion to neighbors
-            old_congestion = other_sector.get("congestion_level", 0.0)
-            new_congestion = min(1.0, old_congestion + congestion_spillover * 0.1)
-            other_sector["congestion_level"] = new_congestion
-            
-            # Update travel time multiplier
-            other_sector["travel_time_multiplier"] = 1.0 + (new_congestion * 2.0)
+    old_status, congestion_spillover = _apply_route_block(sector, reason, duration_minutes)
     
     if get_verbosity() != VerbosityLevel.SILENT:
-        logger.info(f"Route blocked in sector {sector}: {reason}")
+        logger.info("Route blocked in sector %s: %s", sector, reason)
     
-    return {
+    return Response(orjson.dumps({
         "success": True,
         "sector": sector,
-        "old_status": old_status,
-        "new_status": TrafficStatus.BLOCKED,
+        "old_status": _status_str(old_status),
+        "new_status": TrafficStatus.BLOCKED.value,
         "reason": reason,
         "duration_minutes": duration_minutes,
         "travel_time_multiplier": 5.0,
         "spillover_effect": f"Increased congestion in neighboring sectors by {congestion_spillover * 0.1:.2f}"
-    }
+    }), media_type="application/json")
 
-@app.post("/traffic/report_conditions", response_model=Dict[str, Any])
-async def report_conditions(
+@app.post("/traffic/report_conditions")
+def report_conditions(
     description: Optional[str] = Query(None, description="Optional description of traffic conditions"),
     service_status: Dict = Depends(get_service_status)
 ):
@@ -226,66 +326,77 @@ async def report_conditions(
     
     This is one of the 3 essential traffic actions.
     """
-    if get_verbosity() in [VerbosityLevel.VERBOSE, VerbosityLevel.DEBUG]:
-        logger.debug("Reporting traffic conditions")
-    
-    # Calculate overall traffic metrics
-    total_sectors = len(traffic_sectors)
-    blocked_sectors = sum(1 for sector in traffic_sectors.values() if sector.get("is_blocked", False))
-    
-    # Count sectors by status
-    status_counts = {}
-    for status in TrafficStatus:
-        status_counts[status.value] = sum(
-            1 for sector in traffic_sectors.values() 
-            if sector["status"] == status.value
-        )
-    
-    # Calculate average congestion (excluding blocked sectors)
-    active_sectors = [s for s in traffic_sectors.values() if not s.get("is_blocked", False)]
-    avg_congestion = sum(s.get("congestion_level", 0.0) for s in active_sectors) / len(active_sectors) if active_sectors else 0
+    global _report_cache
     
-    # Find most congested sectors
-    congested_sectors = [
-        {"sector_id": sid, "congestion": sector.get("congestion_level", 0.0)}
-        for sid, sector in traffic_sectors.items()
-        if sector.get("congestion_level", 0.0) > 0.7 and not sector.get("is_blocked", False)
-    ]
-    congested_sectors.sort(key=lambda x: x["congestion"], reverse=True)
+    if logger.isEnabledFor(logging.DEBUG) and get_verbosity() in VERBOSE_LEVELS:
+        logger.debug("Reporting traffic conditions")
     
-    # Calculate average travel time multiplier
-    avg_travel_multiplier = sum(s.get("travel_time_multiplier", 1.0) for s in active_sectors) / len(active_sectors) if active_sectors else 1.0
+    description = description or f"Traffic conditions as of {time.strftime('%H:%M')}"
+    
+    # Take the version and the sector fields together so the report always
+    # describes one consistent state, even while a write is in flight
+    with _state_lock:
+        cache_key = (_state_version, description)
+        cached = _report_cache
+        if cached is not None and cached[0] == cache_key:
+            return Response(cached[1], media_type="application/json")
+        snapshot = [
+            (sid, sector.status, sector.congestion_level, sector.is_blocked,
+             sector.travel_time_multiplier, sector.block_reason)
+            for sid, sector in traffic_sectors.items()
+        ]
+    
+    # Accumulate every metric in a single pass over the snapshot
+    blocked_sectors = 0
+    active_count = 0
+    congestion_sum = 0.0
+    multiplier_sum = 0.0
+    status_counts = dict.fromkeys(_STATUS_VALUES, 0)
+    congested_sectors = []
+    sectors_out = {}
+    for sid, status, congestion, is_blocked, multiplier, block_reason in snapshot:
+        if status in status_counts:
+            status_counts[status] += 1
+        
+        if is_blocked:
+            blocked_sectors += 1
+        else:
+            active_count += 1
+            congestion_sum += congestion
+            multiplier_sum += multiplier
+            if congestion > 0.7:
+                congested_sectors.append({"sector_id": sid, "congestion": congestion})
+        
+        sectors_out[sid] = {
+            "status": _status_str(status),
+            "congestion_level": congestion,
+            "is_blocked": is_blocked,
+            "travel_time_multiplier": multiplier,
+            "block_reason": block_reason
+        }
+    
+    avg_congestion = congestion_sum / active_count if active_count else 0
+    avg_travel_multiplier = multiplier_sum / active_count if active_count else 1.0
+    most_congested = heapq.nlargest(5, congested_sectors, key=lambda x: x["congestion"])
     
     # Determine overall traffic flow efficiency
-    if avg_congestion < 0.3:
-        overall_flow = "excellent"
-    elif avg_congestion < 0.5:
-        overall_flow = "good"
-    elif avg_congestion < 0.7:
-        overall_flow = "moderate"
-    elif avg_congestion < 0.9:
-        overall_flow = "poor"
-    else:
-        overall_flow = "critical"
+    overall_flow = _FLOW_LUT[bisect_right(_FLOW_THRESHOLDS, avg_congestion)]
     
-    return {
-        "total_sectors": total_sectors,
+    report = orjson.dumps({
+        "total_sectors": len(snapshot),
         "blocked_sectors": blocked_sectors,
-        "active_sectors": len(active_sectors),
+        "active_sectors": active_count,
         "status_counts": status_counts,
         "average_congestion": avg_congestion,
         "average_travel_multiplier": avg_travel_multiplier,
         "overall_flow": overall_flow,
-        "most_congested": congested_sectors[:5],  # Top 5 most congested
-        "description": description or f"Traffic conditions as of {datetime.now().strftime('%H:%M')}",
-        "sectors": {sid: {
-            "status": sector["status"],
-            "congestion_level": sector.get("congestion_level", 0.0),
-            "is_blocked": sector.get("is_blocked", False),
-            "travel_time_multiplier": sector.get("travel_time_multiplier", 1.0),
-            "block_reason": sector.get("block_reason")
-        } for sid, sector in traffic_sectors.items()}
-    }
+        "most_congested": most_congested,  # Top 5 most congested
+        "description": description,
+        "sectors": sectors_out
+    })
+    _report_cache = (cache_key, report)
+    
+    return Response(report, media_type="application/json")
 
 # ============================================================================
 # ESSENTIAL SUPPORT ENDPOINTS - Health, State Management
@@ -294,7 +405,7 @@ async def report_conditions(
 @app.get("/service/health", response_model=ServiceHealthResponse)
 async def get_service_health():
     """Get service health status."""
-    return service_health
+    return Response(_health_bytes, media_type="application/json")
 
 @app.post("/service/health")
 async def set_service_health(
@@ -303,12 +414,28 @@ async def set_service_health(
     error_rate: float = Query(0.0, ge=0.0, le=1.0)
 ):
     """Set service health parameters for testing."""
+    global _health_bytes
+    
     service_health["status"] = status
     service_health["latency"] = latency
     service_health["error_rate"] = error_rate
+    _health_bytes = orjson.dumps(service_health)
     return service_health
 
-def normalize_traffic_data(state: Dict[str, Any]) -> Dict[str, Any]:
+# Sector payloads in this service's own shape need no fallback key lookups
+_CANONICAL_SECTOR_KEYS = frozenset({"status", "congestion_level", "is_blocked", "travel_time_multiplier"})
+_LEGACY_SECTOR_KEYS = frozenset({"congestion", "blocked"})
+
+def _is_canonical(traffic_data: Dict[str, Any]) -> bool:
+    """Check whether every sector already uses the canonical field names."""
+    return all(
+        isinstance(sector, dict)
+        and sector.keys() >= _CANONICAL_SECTOR_KEYS
+        and sector.keys().isdisjoint(_LEGACY_SECTOR_KEYS)
+        for sector in traffic_data.values()
+    )
+
+def normalize_traffic_data(state: Dict[str, Any]) -> Dict[str, Sector]:
     """Normalize traffic data to ensure consistent structure."""
     normalized = {}
     
@@ -320,54 +447,73 @@ def normalize_traffic_data(state: Dict[str, Any]) -> Dict[str, Any]:
         return {}
     
     # Handle both dict and list formats
-    if isinstance(traffic_data, dict):
+    if isinstance(traffic_data, dict) and _is_canonical(traffic_data):
+        return {
+            sector_id: Sector(
+                sector_id,
+                _coerce_status(sector["status"]),
+                sector["congestion_level"],
+                sector["is_blocked"],
+                sector["travel_time_multiplier"]
+            )
+            for sector_id, sector in traffic_data.items()
+        }
+    elif isinstance(traffic_data, dict):
         for sector_id, sector in traffic_data.items():
-            normalized[sector_id] = {
-                "sector_id": sector_id,
-                "status": sector.get("status", "clear"),
-                "congestion_level": sector.get("congestion", sector.get("congestion_level", 0.0)),
-                "is_blocked": sector.get("blocked", sector.get("is_blocked", False)),
-                "travel_time_multiplier": sector.get("travel_time_multiplier", 1.0)
-            }
+            normalized[sector_id] = Sector(
+                sector_id=sector_id,
+                status=_coerce_status(sector.get("status", "clear")),
+                congestion_level=sector.get("congestion", sector.get("congestion_level", 0.0)),
+                is_blocked=sector.get("blocked", sector.get("is_blocked", False)),
+                travel_time_multiplier=sector.get("travel_time_multiplier", 1.0)
+            )
     elif isinstance(traffic_data, list):
         for sector in traffic_data:
             sector_id = sector.get("id") or sector.get("sector_id") or sector.get("zone_id")
             if sector_id:
-                normalized[sector_id] = {
-                    "sector_id": sector_id,
-                    "status": sector.get("status", "clear"),
-                    "congestion_level": sector.get("congestion", sector.get("congestion_level", 0.0)),
-                    "is_blocked": sector.get("blocked", sector.get("is_blocked", False)),
-                    "travel_time_multiplier": sector.get("travel_time_multiplier", 1.0)
-                }
+                normalized[sector_id] = Sector(
+                    sector_id=sector_id,
+                    status=_coerce_status(sector.get("status", "clear")),
+                    congestion_level=sector.get("congestion", sector.get("congestion_level", 0.0)),
+                    is_blocked=sector.get("blocked", sector.get("is_blocked", False)),
+                    travel_time_multiplier=sector.get("travel_time_multiplier", 1.0)
+                )
     
     return normalized
 
 @app.post("/state/set", response_model=Dict[str, Any])
-async def set_traffic_state(state: Dict[str, Any]):
+def set_traffic_state(state: Dict[str, Any]):
     """Set the traffic state (used by scenario activation)."""
-    global traffic_sectors
+    global traffic_sectors, _active_sectors
     
-    if get_verbosity() in [VerbosityLevel.VERBOSE, VerbosityLevel.DEBUG]:
+    if logger.isEnabledFor(logging.DEBUG) and get_verbosity() in VERBOSE_LEVELS:
         logger.debug("Setting traffic state from scenario")
     
     normalized = normalize_traffic_data(state)
-    if normalized:
-        traffic_sectors = normalized
-    
-    return {"success": True, "sectors_updated": len(traffic_sectors)}
+    with _state_lock:
+        if normalized:
+            traffic_sectors = normalized
+            _active_sectors = _unblocked_sectors(normalized)
+            _mark_state_changed()
+        sectors_updated = len(traffic_sectors)
+    
+    return {"success": True, "sectors_updated": sectors_updated}
 
 @app.get("/state/get", response_model=Dict[str, Any])
-async def get_traffic_state():
+def get_traffic_state():
     """Get the current traffic state."""
-    return {"sectors": traffic_sectors}
+    return Response(_state_snapshot, media_type="application/json")
 
 @app.post("/state/reset", response_model=Dict[str, Any])
-async def reset_traffic_state():
+def reset_traffic_state():
     """Reset traffic state to initial values."""
-    global traffic_sectors
+    global traffic_sectors, _active_sectors
     
-    traffic_sectors = traffic_generator.generate_traffic_data(num_sectors=10)
+    sectors = generate_sectors(traffic_generator)
+    with _state_lock:
+        traffic_sectors = sectors
+        _active_sectors = _unblocked_sectors(sectors)
+        _mark_state_changed()
     
     return {"success": True, "message": "Traffic state reset to initial values"}
 
@@ -6,8 +6,11 @@ This module contains all the state management functions needed for the workshop
 to properly handle scenario initialization and service state coordination.
 """
 
+import orjson
 import requests
 import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 
 from .state_models import ScenarioDefinition
@@ -22,30 +25,141 @@ SERVICE_URLS = {
     "scenario": "http://localhost:8005"
 }
 
+# One pooled session for every service call, so the reset -> create -> activate
+# -> verify cycle reuses connections; mounted on the scheme because the main
+# workshop may repoint SERVICE_URLS after import
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=len(SERVICE_URLS), pool_maxsize=16))
+
+# Callbacks run whenever service state is reset or replaced, so that cached
+# views of the running services (e.g. service IDs) can be invalidated
+_state_change_callbacks = []
+
+
+def on_state_change(callback):
+    """Register a callback to run after service states are reset or set."""
+    _state_change_callbacks.append(callback)
+    return callback
+
+
+def _print_lines(lines):
+    """Print per-service report lines in one console write, without markup parsing."""
+    if lines:
+        console.print("\n".join(lines), markup=False, highlight=False, emoji=False)
+
+
+def _notify_state_change():
+    """Run all registered state-change callbacks."""
+    for callback in _state_change_callbacks:
+        callback()
+
+
+def _map_concurrently(func, items):
+    """Apply func to each item on its own thread; results keep the input order."""
+    items = list(items)
+    with ThreadPoolExecutor(max_workers=max(len(items), 1)) as pool:
+        return list(pool.map(func, items))
+
+
+def _reset_service(url):
+    """POST a state reset to one service; returns the status code or the error."""
+    try:
+        return _SESSION.post(f"{url}/state/reset", timeout=10).status_code
+    except requests.RequestException as e:
+        return e
+
+
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# Gateway-style answers that mean the request never reached a working handler
+_UNPROCESSED_STATUSES = frozenset({502, 503, 504})
+
+
+def _request_with_backoff(method, url, *, attempts: int = 3, base: float = 0.1,
+                          cap: float = 1.0, **kwargs):
+    """
+    Send a request, retrying briefly on transient failures.
+    
+    Connection failures are always retried. Idempotent methods are also
+    retried on any 5xx; other methods (the scenario POSTs) only on 502/503/504,
+    since a plain 500 may come after the service already acted. Read timeouts
+    are never retried for the same reason.
+    """
+    retry_statuses = (range(500, 600) if method.upper() in _IDEMPOTENT_METHODS
+                      else _UNPROCESSED_STATUSES)
+    delay = base
+    for attempt in range(attempts):
+        last = attempt == attempts - 1
+        try:
+            response = _SESSION.request(method, url, **kwargs)
+        except requests.ConnectionError:
+            if last:
+                raise
+        else:
+            if response.status_code not in retry_statuses or last:
+                return response
+        time.sleep(min(delay, cap))
+        delay *= 2
+
+
+def _post_json(url, body, timeout):
+    """POST a JSON body encoded with orjson instead of requests' stdlib encoder."""
+    return _SESSION.post(url, data=orjson.dumps(body),
+                         headers={"Content-Type": "application/json"},
+                         timeout=timeout)
+
+
+def _state_status(url):
+    """Status code of one service's state endpoint, or None if unreachable."""
+    try:
+        return _SESSION.get(f"{url}/state/get", timeout=1).status_code
+    except requests.RequestException:
+        return None
+
+
+def _wait_until_ready(urls, timeout: float = 2.0):
+    """Poll the services' state endpoints until all answer, backing off between rounds."""
+    delay = 0.02
+    deadline = time.monotonic() + timeout
+    while True:
+        if all(code == 200 for code in _map_concurrently(_state_status, urls)):
+            return True
+        if time.monotonic() + delay >= deadline:
+            return False
+        time.sleep(delay)
+        delay = min(delay * 1.3, 0.2)
+
 
 def reset_all_service_states():
     """Reset state across all services to ensure clean test environment."""
     console.print("🔄 Resetting all service states...")
     
+    # Services reset independently, so one slow service no longer delays the rest
+    outcomes = _map_concurrently(_reset_service, SERVICE_URLS.values())
+    
     reset_results = {}
-    for service, url in SERVICE_URLS.items():
-        try:
-            response = requests.post(f"{url}/state/reset", timeout=10)
-            if response.status_code == 200:
-                reset_results[service] = "✅ Reset successful"
-                console.print(f"  ✅ {service.upper()} state reset")
-            else:
-                error_msg = f"❌ Reset failed: HTTP {response.status_code}"
-                reset_results[service] = error_msg
-                console.print(
-                    f"  ❌ {service.upper()} reset failed: "
-                    f"HTTP {response.status_code}")
-        except Exception as e:
-            reset_results[service] = f"❌ Reset error: {str(e)}"
-            console.print(f"  ❌ {service.upper()} reset error: {e}")
+    lines = []
+    for service, outcome in zip(SERVICE_URLS, outcomes):
+        if isinstance(outcome, Exception):
+            reset_results[service] = f"❌ Reset error: {str(outcome)}"
+            lines.append(f"  ❌ {service.upper()} reset error: {outcome}")
+        elif outcome == 200:
+            reset_results[service] = "✅ Reset successful"
+            lines.append(f"  ✅ {service.upper()} state reset")
+        else:
+            error_msg = f"❌ Reset failed: HTTP {outcome}"
+            reset_results[service] = error_msg
+            lines.append(
+                f"  ❌ {service.upper()} reset failed: "
+                f"HTTP {outcome}")
+    _print_lines(lines)
     
-    # Wait a moment for states to stabilize
-    time.sleep(2)
+    # Wait (at most as long as the old fixed pause) for the reset services to
+    # serve their state again, instead of always sleeping the full time
+    reset_urls = [url for url, outcome in zip(SERVICE_URLS.values(), outcomes)
+                  if outcome == 200]
+    if reset_urls:
+        _wait_until_ready(reset_urls)
+    _notify_state_change()
     
     return reset_results
 
@@ -65,9 +179,11 @@ def activate_scenario(scenario: ScenarioDefinition, scenario_name: str = None):
         reset_all_service_states()
         
         # Create scenario in scenario service
-        scenario_response = requests.post(
-            f"{SERVICE_URLS['scenario']}/scenarios", 
-            json=scenario.dict(),
+        scenario_response = _request_with_backoff(
+            "POST", f"{SERVICE_URLS['scenario']}/scenarios", 
+            # Serialize in pydantic's core instead of .dict() followed by json.dumps
+            data=scenario.model_dump_json(),
+            headers={"Content-Type": "application/json"},
             timeout=10
         )
         
@@ -82,8 +198,8 @@ def activate_scenario(scenario: ScenarioDefinition, scenario_name: str = None):
             console.print(f"  📋 Scenario created with ID: {scenario_id}")
         
         # Activate scenario across all services
-        activation_response = requests.post(
-            f"{SERVICE_URLS['scenario']}/scenarios/{scenario_id}/activate",
+        activation_response = _request_with_backoff(
+            "POST", f"{SERVICE_URLS['scenario']}/scenarios/{scenario_id}/activate",
             timeout=15
         )
         
@@ -93,14 +209,13 @@ def activate_scenario(scenario: ScenarioDefinition, scenario_name: str = None):
             activation_data = activation_response.json()
             
             # Show activation results
-            for service, result in activation_data.get("results", {}).items():
-                if "error" in result:
-                    console.print(
-                        f"    ❌ {service.upper()}: {result['error']}")
-                else:
-                    console.print(
-                        f"    ✅ {service.upper()}: State initialized")
-                    
+            _print_lines([
+                f"    ❌ {service.upper()}: {result['error']}" if "error" in result
+                else f"    ✅ {service.upper()}: State initialized"
+                for service, result in activation_data.get("results", {}).items()
+            ])
+            
+            _notify_state_change()
             return True
         else:
             console.print(
@@ -121,43 +236,26 @@ def manual_state_activation(scenario: ScenarioDefinition, scenario_name: str):
     activation_results = {}
     
     try:
-        # Set grid state
-        grid_state = {
-            "zones": {k: v.dict() for k, v in 
-                      scenario.initial_state.zones.items()}
-        }
-        grid_response = requests.post(
-            f"{SERVICE_URLS['grid']}/state/set", 
-            json=grid_state, timeout=10)
-        activation_results["grid"] = grid_response.status_code == 200
-        status_icon = '✅' if activation_results['grid'] else '❌'
-        console.print(f"    {status_icon} Grid state set")
-        
-        # Set emergency state  
-        emergency_state = {
-            "incidents": [incident.dict() for incident in 
-                          scenario.initial_state.incidents],
-            "drones": [drone.dict() for drone in 
-                       scenario.initial_state.drones]
+        # Build every payload first, then set the three services concurrently.
+        # One model_dump per service walks the state in pydantic's core rather
+        # than calling .dict() on each zone, incident, drone and sector
+        state = scenario.initial_state
+        payloads = {
+            "grid": state.model_dump(include={"zones"}),
+            "emergency": state.model_dump(include={"incidents", "drones"}),
+            "traffic": {"sectors": state.model_dump(include={"traffic"})["traffic"]}
         }
-        emergency_response = requests.post(
-            f"{SERVICE_URLS['emergency']}/state/set", 
-            json=emergency_state, timeout=10)
-        activation_results["emergency"] = emergency_response.status_code == 200
-        status_icon = '✅' if activation_results['emergency'] else '❌'
-        console.print(f"    {status_icon} Emergency state set")
+        responses = _map_concurrently(
+            lambda item: _post_json(
+                f"{SERVICE_URLS[item[0]]}/state/set", item[1], timeout=10),
+            payloads.items())
         
-        # Set traffic state
-        traffic_state = {
-            "sectors": {k: v.dict() for k, v in 
-                        scenario.initial_state.traffic.items()}
-        }
-        traffic_response = requests.post(
-            f"{SERVICE_URLS['traffic']}/state/set", 
-            json=traffic_state, timeout=10)
-        activation_results["traffic"] = traffic_response.status_code == 200
-        status_icon = '✅' if activation_results['traffic'] else '❌'
-        console.print(f"    {status_icon} Traffic state set")
+        lines = []
+        for service, response in zip(payloads, responses):
+            activation_results[service] = response.status_code == 200
+            status_icon = '✅' if activation_results[service] else '❌'
+            lines.append(f"    {status_icon} {service.capitalize()} state set")
+        _print_lines(lines)
         
         success_count = sum(activation_results.values())
         total_services = len(activation_results)
@@ -176,6 +274,8 @@ def manual_state_activation(scenario: ScenarioDefinition, scenario_name: str):
     except Exception as e:
         console.print(f"  ❌ Manual state activation failed: {e}")
         return False
+    finally:
+        _notify_state_change()
 
 
 def verify_scenario_state(scenario: ScenarioDefinition, 
@@ -183,63 +283,68 @@ def verify_scenario_state(scenario: ScenarioDefinition,
     """Verify that services have the correct scenario state activated."""
     if scenario_name is None:
         scenario_name = scenario.name
+    
+    # Expected entity counts, read once from the scenario's initial state
+    state = scenario.initial_state
+    expected_zones = len(state.zones)
+    expected_incidents = len(state.incidents)
+    expected_drones = len(state.drones)
+    expected_sectors = len(state.traffic)
         
     console.print(f"🔍 Verifying scenario state: {scenario_name}")
     
     verification_results = {}
     
     try:
+        # The three state reads are independent, so fetch them together
+        grid_response, emergency_response, traffic_response = _map_concurrently(
+            lambda service: _SESSION.get(
+                f"{SERVICE_URLS[service]}/state/get", timeout=5),
+            ("grid", "emergency", "traffic"))
+        
+        lines = []
         # Check grid state
-        grid_response = requests.get(
-            f"{SERVICE_URLS['grid']}/state/get", timeout=5)
         if grid_response.status_code == 200:
             grid_data = grid_response.json()
-            expected_zones = len(scenario.initial_state.zones)
             actual_zones = len(grid_data.get("zones", {}))
             verification_results["grid"] = actual_zones >= expected_zones
             status_icon = '✅' if verification_results['grid'] else '❌'
-            console.print(
+            lines.append(
                 f"  {status_icon} Grid: {actual_zones} zones "
                 f"(expected ≥{expected_zones})")
         else:
             verification_results["grid"] = False
-            console.print("  ❌ Grid state check failed")
+            lines.append("  ❌ Grid state check failed")
             
         # Check emergency state
-        emergency_response = requests.get(
-            f"{SERVICE_URLS['emergency']}/state/get", timeout=5)
         if emergency_response.status_code == 200:
             emergency_data = emergency_response.json()
-            expected_incidents = len(scenario.initial_state.incidents)
-            expected_drones = len(scenario.initial_state.drones)
             actual_incidents = len(emergency_data.get("incidents", {}))
             actual_drones = len(emergency_data.get("drones", {}))
             verification_results["emergency"] = (
                 actual_incidents >= expected_incidents and 
                 actual_drones >= expected_drones)
             status_icon = '✅' if verification_results['emergency'] else '❌'
-            console.print(
+            lines.append(
                 f"  {status_icon} Emergency: {actual_incidents} incidents, "
                 f"{actual_drones} drones")
         else:
             verification_results["emergency"] = False
-            console.print("  ❌ Emergency state check failed")
+            lines.append("  ❌ Emergency state check failed")
             
         # Check traffic state
-        traffic_response = requests.get(
-            f"{SERVICE_URLS['traffic']}/state/get", timeout=5)
         if traffic_response.status_code == 200:
             traffic_data = traffic_response.json()
-            expected_sectors = len(scenario.initial_state.traffic)
             actual_sectors = len(traffic_data.get("sectors", {}))
             verification_results["traffic"] = actual_sectors >= expected_sectors
             status_icon = '✅' if verification_results['traffic'] else '❌'
-            console.print(
+            lines.append(
                 f"  {status_icon} Traffic: {actual_sectors} sectors "
                 f"(expected ≥{expected_sectors})")
         else:
             verification_results["traffic"] = False
-            console.print("  ❌ Traffic state check failed")
+            lines.append("  ❌ Traffic state check failed")
+        _print_lines(lines)
             
         success_count = sum(verification_results.values())
         total_services = len(verification_results)
@@ -260,11 +365,49 @@ def verify_scenario_state(scenario: ScenarioDefinition,
         return False
 
 
-def get_actual_service_ids():
-    """Get actual IDs from running services to avoid hardcoded scenario IDs."""
+# Last complete get_actual_service_ids() answer; reused briefly so back-to-back
+# callers don't each repeat the two status requests. Fallback answers from a
+# failed lookup are never cached.
+_IDS_TTL = 1.0
+_ids_cache = {"timestamp": 0.0, "ids": None}
+
+
+def _clear_ids_cache():
+    """Forget the cached service IDs."""
+    _ids_cache["ids"] = None
+
+
+# A reset or activation replaces the IDs, so never serve the previous ones
+on_state_change(_clear_ids_cache)
+
+
+def get_actual_service_ids(force: bool = False):
+    """
+    Get actual IDs from running services to avoid hardcoded scenario IDs.
+    
+    Args:
+        force: Query the services even if a recent answer is cached
+    """
+    now = time.monotonic()
+    cached = _ids_cache["ids"]
+    if force or cached is None or now - _ids_cache["timestamp"] >= _IDS_TTL:
+        cached, complete = _fetch_service_ids()
+        _ids_cache.update(timestamp=now, ids=cached if complete else None)
+    # Hand out copies so callers can't edit the cached lists
+    return {key: list(ids) for key, ids in cached.items()}
+
+
+def _fetch_service_ids():
+    """
+    Query the grid and emergency services for their current IDs.
+    
+    Returns:
+        (ids, complete) where complete is False if either service could not
+        be read and the IDs are partly or wholly fallbacks
+    """
     try:
         # Get actual grid zones
-        grid_response = requests.get(
+        grid_response = _SESSION.get(
             f"{SERVICE_URLS['grid']}/grid/report_status", timeout=5)
         grid_zones = []
         if grid_response.status_code == 200:
@@ -272,7 +415,7 @@ def get_actual_service_ids():
             grid_zones = list(grid_data.get("zones", {}).keys())
         
         # Get actual emergency drones and incidents  
-        emergency_response = requests.get(
+        emergency_response = _SESSION.get(
             f"{SERVICE_URLS['emergency']}/emergency/report_status", 
             timeout=5)
         drones = []
@@ -285,13 +428,15 @@ def get_actual_service_ids():
         # Get actual traffic sectors (default fallback)
         traffic_sectors = ["S001", "S002", "S003", "S004", "S005"]
         
+        complete = (grid_response.status_code == 200
+                    and emergency_response.status_code == 200)
         return {
             "grid_zones": grid_zones,
             "drones": drones, 
             "incidents": incidents,
             "traffic_sectors": traffic_sectors
-        }
-    except Exception as e:
+        }, complete
+    except requests.RequestException as e:
         console.print(
             f"[yellow]Warning: Could not get actual service IDs: {e}[/yellow]")
         # Return fallback IDs
@@ -300,19 +445,20 @@ def get_actual_service_ids():
             "drones": ["D001", "D002", "D003", "D004", "D005"],
             "incidents": ["E-1001", "E-1002", "E-1003", "E-1004", "E-1005"],
             "traffic_sectors": ["S001", "S002", "S003", "S004", "S005"]
-        }
+        }, False
+
+
+def _service_status(url):
+    """Fetch one service's state, or an error marker if it cannot be read."""
+    try:
+        response = _SESSION.get(f"{url}/state/get", timeout=5)
+        if response.status_code == 200:
+            return response.json()
+        return {"error": "unavailable"}
+    except requests.RequestException:
+        return {"error": "connection failed"}
 
 
 def get_system_status():
     """Get current status from all services."""
-    status = {}
-    for service, url in SERVICE_URLS.items():
-        try:
-            response = requests.get(f"{url}/state/get", timeout=5)
-            if response.status_code == 200:
-                status[service] = response.json()
-            else:
-                status[service] = {"error": "unavailable"}
-        except Exception:
-            status[service] = {"error": "connection failed"}
-    return status 
\ No newline at end of file
+    return dict(zip(SERVICE_URLS, _map_concurrently(_service_status, SERVICE_URLS.values())))
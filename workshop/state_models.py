@@ -5,11 +5,13 @@ This module provides Pydantic models for consistent state management
 across all services in the SENTINEL GRID system.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Dict, List, Optional, Any
 
 class ZoneState(BaseModel):
     """Base state for a grid zone."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     capacity: float = Field(ge=0.0, le=1.0)
@@ -20,6 +22,8 @@ class ZoneState(BaseModel):
 
 class WeatherState(BaseModel):
     """Base state for weather conditions."""
+    model_config = ConfigDict(frozen=True)
+
     condition: str
     temperature: float
     wind_speed: float
@@ -29,6 +33,8 @@ class WeatherState(BaseModel):
 
 class IncidentState(BaseModel):
     """Base state for an emergency incident."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     description: str
     location: str
@@ -38,6 +44,8 @@ class IncidentState(BaseModel):
 
 class DroneState(BaseModel):
     """Base state for an emergency drone."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     status: str = Field(default="available")
@@ -48,6 +56,8 @@ class DroneState(BaseModel):
 
 class TrafficState(BaseModel):
     """Base state for traffic conditions."""
+    model_config = ConfigDict(frozen=True)
+
     zone_id: str
     congestion: float = Field(ge=0.0, le=1.0)
     blocked: bool = False
@@ -81,6 +91,8 @@ class ServiceState(BaseModel):
 
 class SuccessCriteria(BaseModel):
     """Success criteria for a scenario."""
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
     metrics: Dict[str, Any]